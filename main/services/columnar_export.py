@@ -0,0 +1,110 @@
+"""
+Columnar (Parquet / Arrow IPC) export of the normalized experiment corpus.
+
+Analytics jobs can read only the columns they need from the exported file
+instead of parsing the JSONL metadata. Requires the optional 'pyarrow'
+package (pip install pyarrow); the web app itself does not depend on it.
+
+Usage:
+    python -m main.services.columnar_export static/data/osd_metadata.parquet
+"""
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+from main.services.normalizer import CATEGORY_FIELDS, TEXT_FIELDS, URL_FIELDS, load_corpus
+
+# Resolved from this module so the export works from any working directory.
+DEFAULT_SOURCE = str(Path(__file__).resolve().parents[2] / 'static' / 'data' / 'enhanced_osd_metadata.jsonl')
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Columnar export requires 'pyarrow'. Install it with: pip install pyarrow")
+
+
+def build_table(experiments: Dict[str, Dict[str, Any]]) -> "pa.Table":
+    """
+    Converts normalized experiments into an Arrow table.
+
+    Category columns are dictionary-encoded, dates are date32 columns
+    (null when unknown) and key_findings is a list<string> column.
+    """
+    _require_pyarrow()
+    records = [{'osd_id': osd_id, **exp} for osd_id, exp in experiments.items()]
+
+    columns = {'osd_id': pa.array([r['osd_id'] for r in records], pa.string())}
+    for field in CATEGORY_FIELDS:
+        columns[field] = pa.array([r[field] or None for r in records], pa.string()).dictionary_encode()
+    for field in TEXT_FIELDS + URL_FIELDS + ('start_date', 'end_date'):
+        columns[field] = pa.array([r[field] for r in records], pa.string())
+    columns['start_date_parsed'] = pa.array([r['start_date_parsed'] for r in records], pa.date32())
+    columns['end_date_parsed'] = pa.array([r['end_date_parsed'] for r in records], pa.date32())
+    columns['key_findings'] = pa.array([r['key_findings'] for r in records], pa.list_(pa.string()))
+
+    return pa.table(columns)
+
+
+def export_corpus(experiments: Dict[str, Dict[str, Any]], output_path: str) -> "pa.Table":
+    """
+    Writes the corpus to 'output_path'. A '.parquet' suffix writes Parquet,
+    anything else ('.arrow', '.feather') writes an uncompressed Arrow IPC file
+    suitable for memory mapping.
+    """
+    table = build_table(experiments)
+    if output_path.endswith('.parquet'):
+        pq.write_table(table, output_path)
+    else:
+        feather.write_feather(table, output_path, compression='uncompressed')
+    return table
+
+
+def read_corpus(path: str, columns=None) -> "pa.Table":
+    """Reads an exported corpus, optionally restricted to the given columns."""
+    _require_pyarrow()
+    if path.endswith('.parquet'):
+        return pq.read_table(path, columns=columns)
+    return feather.read_table(path, columns=columns, memory_map=True)
+
+
+def missions_per_year_by_organism(table: "pa.Table") -> "pa.Table":
+    """
+    Counts studies per (start year, organism_category, mission_category).
+    Studies without a parsed start date are left out.
+    """
+    _require_pyarrow()
+    dated = table.filter(pc.is_valid(table['start_date_parsed']))
+    grouped = pa.table({
+        'year': pc.year(dated['start_date_parsed']),
+        'organism_category': dated['organism_category'].cast(pa.string()),
+        'mission_category': dated['mission_category'].cast(pa.string()),
+    })
+    counts = grouped.group_by(['year', 'organism_category', 'mission_category']).aggregate(
+        [('year', 'count')])
+    counts = counts.select(['year', 'organism_category', 'mission_category', 'year_count'])
+    return counts.rename_columns(['year', 'organism_category', 'mission_category', 'study_count']).sort_by([
+        ('year', 'ascending'), ('organism_category', 'ascending'), ('mission_category', 'ascending'),
+    ])
+
+
+# --- Main execution block ---
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m main.services.columnar_export <output.parquet|output.arrow> [source.jsonl]")
+        sys.exit(1)
+
+    output_file = sys.argv[1]
+    source_file = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_SOURCE
+
+    corpus, report = load_corpus(source_file)
+    report.print_summary()
+    exported = export_corpus(corpus, output_file)
+    print(f"INFO: Wrote {exported.num_rows} experiments ({exported.num_columns} columns) to {output_file}")
@@ -1,7 +1,9 @@
-import json
 import os
+from bisect import bisect_left, bisect_right
 from django.conf import settings
 
+from main.services.normalizer import CATEGORY_FIELDS, enumerate_categories, load_corpus
+
 
 class ExperimentDataHandler:
     """
@@ -10,6 +12,13 @@ class ExperimentDataHandler:
     _instance = None
     _data_loaded = False
     experiments = {}
+    categories = {}
+    # Date index: parallel lists sorted by start date (undated studies are not indexed)
+    _start_dates = []
+    _start_date_ids = []
+    _date_rank = {}
+    _file_position = {}
+    timeline = {}
 
     def __new__(cls):
         """Ensures only one instance of the class is created (Singleton pattern)."""
@@ -19,7 +28,7 @@ class ExperimentDataHandler:
         return cls._instance
 
     def _load_data(self):
-        """Loads data from the JSONL file into the in-memory 'experiments' dictionary."""
+        """Loads and normalizes the JSONL file into the in-memory 'experiments' dictionary."""
         if self._data_loaded:
             return
 
@@ -36,50 +45,88 @@ class ExperimentDataHandler:
             return
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        line_data = json.loads(line.strip())
-                        # The key is the OSD ID, the value is the experiment data
-                        osd_id, exp_data = next(iter(line_data.items()))
-                        self.experiments[osd_id] = exp_data
-
-                        # Ensure key_findings is a list
-                        kf = self.experiments[osd_id].get('key_findings')
-                        if kf and isinstance(kf, str):
-                            self.experiments[osd_id]['key_findings'] = [kf]
-
-                    except Exception as e:
-                        print(f"Error processing line (Skipped): {line.strip()[:50]}... - {e}")
-                        continue
-        except Exception as file_error:
+            # Validation/normalization runs once here; rejected lines are reported, not loaded.
+            self.experiments, report = load_corpus(file_path)
+        except OSError as file_error:
             print(f"FATAL FILE READ ERROR: Could not open or read file: {file_path}. Error: {file_error}")
             return
 
+        report.print_summary()
+        self.categories = enumerate_categories(self.experiments)
+        self._build_date_index()
+
         self._data_loaded = True
         if len(self.experiments) > 0:
             print(f"INFO: Loaded {len(self.experiments)} experiments successfully: {len(self.experiments)} records.")
         else:
             print("WARNING: Data file was found, but 0 experiments were loaded. Check file format.")
 
+    def _build_date_index(self):
+        """
+        Builds the sorted start-date arrays used for range queries and date sorting,
+        and precomputes the per-year timeline histogram for every facet.
+        """
+        dated = sorted(
+            (exp['start_date_parsed'], osd_id)
+            for osd_id, exp in self.experiments.items()
+            if exp.get('start_date_parsed')
+        )
+        self._start_dates = [start for start, _ in dated]
+        self._start_date_ids = [osd_id for _, osd_id in dated]
+        self._date_rank = {osd_id: rank for rank, osd_id in enumerate(self._start_date_ids)}
+        # Restores file order for results drawn from the date-sorted arrays
+        self._file_position = {osd_id: position for position, osd_id in enumerate(self.experiments)}
+
+        timeline = {'all': {}, **{category: {} for category in CATEGORY_FIELDS}}
+        for start, osd_id in dated:
+            year = start.year
+            timeline['all'][year] = timeline['all'].get(year, 0) + 1
+            for category in CATEGORY_FIELDS:
+                value = self.experiments[osd_id].get(category)
+                if value:
+                    per_year = timeline[category].setdefault(value, {})
+                    per_year[year] = per_year.get(year, 0) + 1
+        self.timeline = timeline
+
     # ------------------ Query Methods ------------------
 
     def get_experiment_by_id(self, osd_id):
         """Returns a single experiment by its OSD-ID."""
         return self.experiments.get(osd_id)
 
-    def search_experiments(self, keyword=None, filters=None):
+    def get_ids_in_date_range(self, date_from=None, date_to=None):
+        """
+        Returns the OSD-IDs whose start date falls within [date_from, date_to] (inclusive),
+        using two binary searches over the sorted start-date array.
+        Either bound may be None for an open-ended range.
         """
-        Searches and filters experiments based on keywords and categories.
+        lo = bisect_left(self._start_dates, date_from) if date_from else 0
+        hi = bisect_right(self._start_dates, date_to) if date_to else len(self._start_dates)
+        return self._start_date_ids[lo:hi]
+
+    def search_experiments(self, keyword=None, filters=None, date_from=None, date_to=None, sort=None):
+        """
+        Searches and filters experiments based on keywords, categories and start date.
+
+        Records are normalized at load time, so every search field is already a string.
 
-        This method now safely converts potential list fields (like publication title)
-        to strings before comparison to avoid 'list' object has no attribute 'lower'.
+        When a date bound is given, only dated studies inside the range are considered.
+        Results keep file order unless 'sort' is 'date_asc' or 'date_desc'; undated
+        studies are listed last.
         """
         results = []
         keyword = keyword.lower() if keyword else ''
         filters = filters or {}
 
-        for exp_id, exp in self.experiments.items():
+        # A date bound narrows the candidates to a slice of the sorted index
+        date_bounded = bool(date_from or date_to)
+        if date_bounded:
+            candidate_ids = self.get_ids_in_date_range(date_from, date_to)
+        else:
+            candidate_ids = self.experiments.keys()
+
+        for exp_id in candidate_ids:
+            exp = self.experiments[exp_id]
 
             # 1. Filter check
             filter_match = True
@@ -94,20 +141,12 @@ class ExperimentDataHandler:
             # 2. Keyword check
             keyword_match = True
             if keyword:
-
-                # Helper function to convert any field to a searchable string
-                def safe_to_string(value):
-                    if isinstance(value, list):
-                        return " ".join(map(str, value))  # Join list elements into a single string
-                    return str(value)  # Convert everything else to a string
-
                 search_fields = [
                     exp.get('short_title', ''),
                     exp.get('summary', ''),
                     exp.get('description', ''),
                     exp.get('organism_category', ''),
-                    # CRITICAL FIX HERE: Explicitly pass the publication title through the safe converter
-                    safe_to_string(exp.get('study_publication_title', '')),
+                    exp.get('study_publication_title', ''),
                     # Key findings are already a list, joined here
                     " ".join(exp.get('key_findings', [])),
                 ]
@@ -120,22 +159,32 @@ class ExperimentDataHandler:
                 exp_with_id = {'osd_id': exp_id, **exp}
                 results.append(exp_with_id)
 
+        if sort in ('date_asc', 'date_desc'):
+            undated = len(self._date_rank)
+            results.sort(key=lambda e: self._date_rank.get(e['osd_id'], undated))
+            if sort == 'date_desc':
+                dated = [e for e in results if e['osd_id'] in self._date_rank]
+                results = dated[::-1] + results[len(dated):]
+        elif date_bounded:
+            results.sort(key=lambda e: self._file_position[e['osd_id']])
+
         return results
 
     def get_unique_filter_values(self):
         """Returns a dictionary of all unique values for filter categories."""
-        unique_values = {
-            'organism_category': set(), 'mission_category': set(),
-            'experiment_type_category': set(), 'data_source_category': set(),
-        }
-
-        for exp in self.experiments.values():
-            for category in unique_values.keys():
-                value = exp.get(category)
-                if value:
-                    unique_values[category].add(value)
+        return {k: list(self.categories.get(k, [])) for k in CATEGORY_FIELDS}
+
+    def get_timeline(self, facet=None):
+        """
+        Returns precomputed per-year study counts (by start date).
 
-        return {k: sorted(list(v)) for k, v in unique_values.items()}
+        Without a facet, returns {'all': {year: count}, <facet>: {value: {year: count}}, ...}.
+        'facet' must be one of CATEGORY_FIELDS; it returns only that facet's
+        {value: {year: count}} mapping ('all' is not a facet and yields {}).
+        """
+        if facet:
+            return self.timeline.get(facet, {}) if facet in CATEGORY_FIELDS else {}
+        return self.timeline
 
 
 # MANDATORY: Initialize the handler once at the end of the module
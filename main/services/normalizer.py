@@ -0,0 +1,193 @@
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# Facet fields shown as dropdowns; their values are enumerated at load time.
+CATEGORY_FIELDS = (
+    'organism_category', 'mission_category',
+    'experiment_type_category', 'data_source_category',
+)
+
+# Free-text fields that must end up as plain strings.
+TEXT_FIELDS = (
+    'short_title', 'short_summary', 'summary', 'description',
+    'study_publication_title', 'data_source_original',
+)
+
+# Link fields are rendered as a single href, so only the first URL of a list is kept.
+URL_FIELDS = ('project_link', 'files')
+
+# A record without these cannot be rendered, so it is rejected.
+REQUIRED_FIELDS = ('short_title',)
+
+# Every date layout seen in the OSDR metadata (e.g. "07/04/2006", "04-Apr-2006", "7/4/06").
+# Slashed numeric dates are month-first; the only dashed numeric dates (OSD-39) are day-first.
+DATE_FORMATS = (
+    '%m/%d/%Y', '%m/%d/%y', '%Y-%m-%d', '%d-%m-%Y',
+    '%d-%b-%Y', '%d-%b-%y', '%b-%d-%Y', '%b-%d %Y',
+)
+
+# Placeholders the source uses for "no date"; these are not reported as problems.
+MISSING_DATE_VALUES = {'', 'na', 'n/a', 'unknown', 'none'}
+
+
+class NormalizationReport:
+    """Collects rejected lines and field-level warnings produced while normalizing the corpus."""
+
+    def __init__(self):
+        self.accepted = 0
+        self.rejects: List[Tuple[int, str]] = []
+        self.warnings: List[Tuple[str, str]] = []
+
+    def reject(self, line_number: int, reason: str):
+        self.rejects.append((line_number, reason))
+
+    def warn(self, osd_id: str, message: str):
+        self.warnings.append((osd_id, message))
+
+    def print_summary(self):
+        """Prints a short summary in the same style as the data handler's load messages."""
+        print(f"INFO: Normalized {self.accepted} experiments "
+              f"({len(self.rejects)} rejected, {len(self.warnings)} field warnings).")
+        for line_number, reason in self.rejects:
+            print(f"  REJECTED line {line_number}: {reason}")
+        for osd_id, message in self.warnings:
+            print(f"  WARNING {osd_id}: {message}")
+
+
+def to_text(value: Any) -> str:
+    """Converts a string, list of strings or None into a single display string."""
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return '; '.join(str(v).strip() for v in value if v not in (None, ''))
+    return str(value).strip()
+
+
+def parse_date(value: str) -> Optional[date]:
+    """Parses a single date string using the known OSDR layouts. Returns None if no layout matches."""
+    value = value.strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def normalize_date(value: Any, osd_id: str, field: str, report: NormalizationReport,
+                   pick_latest: bool = False) -> Optional[date]:
+    """
+    Parses a date field that may be a string or a list of strings.
+
+    For lists (studies with several flights), the earliest date is used for
+    start dates and the latest for end dates.
+    """
+    values = value if isinstance(value, list) else [value]
+    parsed = []
+    for raw in values:
+        if raw is None or str(raw).strip().lower() in MISSING_DATE_VALUES:
+            continue
+        result = parse_date(str(raw))
+        if result is None:
+            report.warn(osd_id, f"unparseable {field} {raw!r}")
+        else:
+            parsed.append(result)
+
+    if not parsed:
+        return None
+    return max(parsed) if pick_latest else min(parsed)
+
+
+def normalize_record(osd_id: str, exp_data: Dict[str, Any], report: NormalizationReport) -> Dict[str, Any]:
+    """
+    Coerces a raw experiment record into its canonical shape.
+
+    Text fields become strings, link fields keep their first URL,
+    key_findings becomes a list of strings, and the raw start/end dates are
+    kept for display alongside parsed 'start_date_parsed'/'end_date_parsed'
+    date objects.
+    """
+    exp = dict(exp_data)
+
+    for field in TEXT_FIELDS + CATEGORY_FIELDS:
+        exp[field] = to_text(exp.get(field))
+
+    for field in URL_FIELDS:
+        value = exp.get(field)
+        exp[field] = to_text(value[0] if isinstance(value, list) and value else value)
+
+    kf = exp.get('key_findings')
+    if not kf:
+        exp['key_findings'] = []
+    elif isinstance(kf, str):
+        exp['key_findings'] = [kf]
+    else:
+        exp['key_findings'] = [str(finding) for finding in kf if finding]
+
+    exp['start_date_parsed'] = normalize_date(exp.get('start_date'), osd_id, 'start_date', report)
+    exp['end_date_parsed'] = normalize_date(exp.get('end_date'), osd_id, 'end_date', report, pick_latest=True)
+    exp['start_date'] = to_text(exp.get('start_date'))
+    exp['end_date'] = to_text(exp.get('end_date'))
+
+    if (exp['start_date_parsed'] and exp['end_date_parsed']
+            and exp['end_date_parsed'] < exp['start_date_parsed']):
+        report.warn(osd_id, "end_date is before start_date")
+
+    return exp
+
+
+def enumerate_categories(experiments: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Returns the sorted list of distinct non-empty values for every facet field."""
+    unique_values = {category: set() for category in CATEGORY_FIELDS}
+    for exp in experiments.values():
+        for category in CATEGORY_FIELDS:
+            if exp.get(category):
+                unique_values[category].add(exp[category])
+    return {k: sorted(v) for k, v in unique_values.items()}
+
+
+def load_corpus(file_path: str) -> Tuple[Dict[str, Dict[str, Any]], NormalizationReport]:
+    """
+    Reads the JSONL metadata file and normalizes every record.
+
+    Each line must be a JSON object with a single OSD-ID key. Lines that are
+    not valid JSON, have the wrong shape, or miss a required field are
+    recorded in the report and skipped.
+    """
+    experiments = {}
+    report = NormalizationReport()
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                line_data = json.loads(line)
+            except json.JSONDecodeError as e:
+                report.reject(line_number, f"invalid JSON ({e})")
+                continue
+
+            if not isinstance(line_data, dict) or len(line_data) != 1:
+                report.reject(line_number, "expected an object with a single OSD-ID key")
+                continue
+
+            osd_id, exp_data = next(iter(line_data.items()))
+            if not isinstance(exp_data, dict):
+                report.reject(line_number, f"{osd_id}: record is not an object")
+                continue
+
+            missing = [field for field in REQUIRED_FIELDS if not to_text(exp_data.get(field))]
+            if missing:
+                report.reject(line_number, f"{osd_id}: missing required field(s) {', '.join(missing)}")
+                continue
+
+            if osd_id in experiments:
+                report.warn(osd_id, f"duplicate record on line {line_number} replaces earlier one")
+
+            experiments[osd_id] = normalize_record(osd_id, exp_data, report)
+
+    report.accepted = len(experiments)
+    return experiments, report
@@ -1,3 +1,192 @@
+import json
+import os
+import tempfile
+from datetime import date
+
 from django.test import TestCase
+from django.utils.html import escape
+
+from main.services.data_handler import ExperimentDataHandler, data_handler
+from main.services.normalizer import (
+    DATE_FORMATS, MISSING_DATE_VALUES, NormalizationReport, load_corpus, normalize_date, normalize_record,
+    parse_date,
+)
+from main.views import _parse_date_param
+
+
+class NormalizerTests(TestCase):
+
+    def write_jsonl(self, lines):
+        """Writes raw lines to a temporary JSONL file and returns its path."""
+        fd, path = tempfile.mkstemp(suffix='.jsonl')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_parse_date_every_layout(self):
+        samples = {
+            '%m/%d/%Y': '07/04/2006',
+            '%m/%d/%y': '7/4/06',
+            '%Y-%m-%d': '2006-07-04',
+            '%d-%m-%Y': '18-10-2003',
+            '%d-%b-%Y': '04-Jul-2006',
+            '%d-%b-%y': '4-Jul-06',
+            '%b-%d-%Y': 'Jul-04-2006',
+            '%b-%d %Y': 'Jul-04 2006',
+        }
+        self.assertEqual(set(samples), set(DATE_FORMATS))
+        for fmt, value in samples.items():
+            expected = date(2003, 10, 18) if fmt == '%d-%m-%Y' else date(2006, 7, 4)
+            self.assertEqual(parse_date(value), expected, fmt)
+
+    def test_parse_date_dashed_numeric_is_day_first(self):
+        self.assertEqual(parse_date('05-10-2003'), date(2003, 10, 5))
+
+    def test_parse_date_unknown_layout(self):
+        self.assertIsNone(parse_date('sometime in 2006'))
+
+    def test_normalize_date_list_picks_min_for_start_and_max_for_end(self):
+        report = NormalizationReport()
+        value = ['03/01/2010', '01/15/2010', '12/31/2010']
+        self.assertEqual(normalize_date(value, 'OSD-X', 'start_date', report), date(2010, 1, 15))
+        self.assertEqual(normalize_date(value, 'OSD-X', 'end_date', report, pick_latest=True), date(2010, 12, 31))
+        self.assertEqual(report.warnings, [])
+
+    def test_missing_date_values_do_not_warn(self):
+        report = NormalizationReport()
+        for value in list(MISSING_DATE_VALUES) + ['Unknown', 'NA', None, ['NA', '']]:
+            self.assertIsNone(normalize_date(value, 'OSD-X', 'start_date', report))
+        self.assertEqual(report.warnings, [])
+
+    def test_unparseable_date_warns(self):
+        report = NormalizationReport()
+        self.assertIsNone(normalize_date('not a date', 'OSD-X', 'start_date', report))
+        self.assertEqual(len(report.warnings), 1)
+
+    def test_load_corpus_rejects_malformed_lines(self):
+        path = self.write_jsonl([
+            json.dumps({'OSD-1': {'short_title': 'Valid', 'study_publication_title': ['A', 'B']}}),
+            '{not json',
+            json.dumps({'OSD-2': {'short_title': 'x'}, 'OSD-3': {'short_title': 'y'}}),
+            json.dumps({'OSD-4': 'not an object'}),
+            json.dumps({'OSD-5': {'summary': 'no title'}}),
+        ])
+        experiments, report = load_corpus(path)
+
+        self.assertEqual(list(experiments), ['OSD-1'])
+        self.assertEqual(report.accepted, 1)
+        self.assertEqual([line for line, _ in report.rejects], [2, 3, 4, 5])
+        self.assertIn('short_title', report.rejects[-1][1])
+        self.assertEqual(experiments['OSD-1']['study_publication_title'], 'A; B')
+
+    def test_load_corpus_warns_on_duplicate_id(self):
+        path = self.write_jsonl([
+            json.dumps({'OSD-1': {'short_title': 'First'}}),
+            json.dumps({'OSD-1': {'short_title': 'Second'}}),
+        ])
+        experiments, report = load_corpus(path)
+
+        self.assertEqual(experiments['OSD-1']['short_title'], 'Second')
+        self.assertEqual(len(report.warnings), 1)
+        self.assertEqual(report.warnings[0][0], 'OSD-1')
+        self.assertIn('duplicate', report.warnings[0][1])
+
+
+class DateIndexTests(TestCase):
+
+    def setUp(self):
+        raw = {
+            'OSD-B': {'short_title': 'B', 'organism_category': 'Rodent', 'start_date': '06/01/2010'},
+            'OSD-U': {'short_title': 'U', 'organism_category': 'Rodent', 'start_date': 'Unknown'},
+            'OSD-A': {'short_title': 'A', 'organism_category': 'Plant', 'start_date': '01/01/2010'},
+            'OSD-C': {'short_title': 'C', 'organism_category': 'Rodent', 'start_date': '12/31/2011'},
+        }
+        report = NormalizationReport()
+        # Bypass the singleton so each test gets its own small corpus.
+        self.handler = object.__new__(ExperimentDataHandler)
+        self.handler.experiments = {osd_id: normalize_record(osd_id, exp, report) for osd_id, exp in raw.items()}
+        self.handler._build_date_index()
+
+    def test_range_bounds_are_inclusive(self):
+        self.assertEqual(self.handler.get_ids_in_date_range(date(2010, 1, 1), date(2010, 6, 1)), ['OSD-A', 'OSD-B'])
+
+    def test_range_open_ended(self):
+        self.assertEqual(self.handler.get_ids_in_date_range(date(2010, 6, 1), None), ['OSD-B', 'OSD-C'])
+        self.assertEqual(self.handler.get_ids_in_date_range(None, date(2010, 5, 31)), ['OSD-A'])
+        self.assertEqual(self.handler.get_ids_in_date_range(), ['OSD-A', 'OSD-B', 'OSD-C'])
+
+    def test_range_from_after_to_is_empty(self):
+        self.assertEqual(self.handler.get_ids_in_date_range(date(2011, 1, 1), date(2010, 1, 1)), [])
+
+    def test_default_order_is_file_order_with_and_without_range(self):
+        ids = [e['osd_id'] for e in self.handler.search_experiments()]
+        self.assertEqual(ids, ['OSD-B', 'OSD-U', 'OSD-A', 'OSD-C'])
+        ids = [e['osd_id'] for e in self.handler.search_experiments(date_from=date(2009, 1, 1))]
+        self.assertEqual(ids, ['OSD-B', 'OSD-A', 'OSD-C'])
+
+    def test_range_intersects_facet_filters(self):
+        results = self.handler.search_experiments(
+            filters={'organism_category': 'Rodent'}, date_from=date(2010, 1, 1), date_to=date(2010, 12, 31),
+        )
+        self.assertEqual([e['osd_id'] for e in results], ['OSD-B'])
+
+    def test_date_sort_lists_undated_last(self):
+        ids = [e['osd_id'] for e in self.handler.search_experiments(sort='date_asc')]
+        self.assertEqual(ids, ['OSD-A', 'OSD-B', 'OSD-C', 'OSD-U'])
+        ids = [e['osd_id'] for e in self.handler.search_experiments(sort='date_desc')]
+        self.assertEqual(ids, ['OSD-C', 'OSD-B', 'OSD-A', 'OSD-U'])
+
+    def test_range_search_does_not_scan_corpus(self):
+        class NoScanDict(dict):
+            def __iter__(self):
+                raise AssertionError('date-bounded search iterated the whole corpus')
+            keys = values = items = __iter__
+
+        self.handler.experiments = NoScanDict(self.handler.experiments)
+        ids = [e['osd_id'] for e in self.handler.search_experiments(date_from=date(2010, 1, 1))]
+        self.assertEqual(ids, ['OSD-B', 'OSD-A', 'OSD-C'])
+
+    def test_timeline_counts_per_year_and_facet(self):
+        self.assertEqual(self.handler.get_timeline()['all'], {2010: 2, 2011: 1})
+        self.assertEqual(self.handler.get_timeline('organism_category'), {
+            'Plant': {2010: 1}, 'Rodent': {2010: 1, 2011: 1},
+        })
+        self.assertEqual(self.handler.get_timeline('all'), {})
+
+
+class DateViewTests(TestCase):
+
+    def test_parse_date_param(self):
+        self.assertEqual(_parse_date_param('2010-01-31'), date(2010, 1, 31))
+        for value in ('', 'bad', '2010-13-01', '01/31/2010'):
+            self.assertIsNone(_parse_date_param(value))
+
+    def test_home_ignores_invalid_date(self):
+        response = self.client.get('/home/', {'from': 'not-a-date'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['current_from'], '')
+        self.assertEqual(len(response.context['experiments']), len(data_handler.experiments))
+
+    def test_home_keeps_dropdowns_selected_with_date_range(self):
+        options = data_handler.get_unique_filter_values()
+        params = {
+            'type': options['experiment_type_category'][0],
+            'organism': options['organism_category'][0],
+            'mission': options['mission_category'][0],
+            'from': '2000-01-01',
+        }
+        response = self.client.get('/home/', params)
+        content = response.content.decode()
+        for key in ('type', 'organism', 'mission'):
+            self.assertIn(f'<option value="{escape(params[key])}" selected', content)
+
+    def test_timeline_endpoint(self):
+        response = self.client.get('/timeline/', {'facet': 'mission_category'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()), set(data_handler.get_timeline('mission_category')))
 
-# Create your tests here.
+    def test_timeline_unknown_facet(self):
+        for facet in ('nope', 'all'):
+            response = self.client.get('/timeline/', {'facet': facet})
+            self.assertEqual(response.status_code, 400, facet)
@@ -6,5 +6,6 @@ urlpatterns = [
     path('', RedirectView.as_view(pattern_name='home', permanent=False)),
     path('home/', views.home, name='home'),
     path('about/', views.about, name='about'),
+    path('timeline/', views.timeline, name='timeline'),
     path('paper/<str:paper_osd>/', views.paper, name='paper'),
 ]
\ No newline at end of file
@@ -1,7 +1,16 @@
+from datetime import date
 from django.shortcuts import render
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse
 # Assuming data_handler is correctly imported from main.services
 from main.services.data_handler import data_handler
+from main.services.normalizer import CATEGORY_FIELDS
+
+def _parse_date_param(value):
+    """Parses a YYYY-MM-DD query parameter (as sent by <input type="date">); returns None if invalid."""
+    try:
+        return date.fromisoformat(value) if value else None
+    except ValueError:
+        return None
 
 def home(request):
     # 1. Get search parameters from the request
@@ -13,8 +22,14 @@ def home(request):
         'experiment_type_category': request.GET.get('type', ''),
     }
 
+    date_from = _parse_date_param(request.GET.get('from', '').strip())
+    date_to = _parse_date_param(request.GET.get('to', '').strip())
+    sort = request.GET.get('sort', '')
+
     # 2. Use the defined function name, search_experiments
-    experiments = data_handler.search_experiments(keyword=keyword, filters=filters)
+    experiments = data_handler.search_experiments(
+        keyword=keyword, filters=filters, date_from=date_from, date_to=date_to, sort=sort,
+    )
 
     # 3. Get unique values for dropdown filters
     filter_options = data_handler.get_unique_filter_values()
@@ -24,6 +39,9 @@ def home(request):
         'filter_options': filter_options,
         'current_keyword': keyword,
         'current_filters': filters,
+        'current_from': date_from.isoformat() if date_from else '',
+        'current_to': date_to.isoformat() if date_to else '',
+        'current_sort': sort,
     }
 
     # FIX: Change the template path to 'home.html' based on your file structure.
@@ -37,5 +55,12 @@ def paper(request, paper_osd):
     context = { "paper": paper}
     return render(request, "paper.html", context)
 
+def timeline(request):
+    """Returns the precomputed per-year study counts as JSON, optionally for a single facet (?facet=...)."""
+    facet = request.GET.get('facet', '')
+    if facet and facet not in CATEGORY_FIELDS:
+        return JsonResponse({'error': f"Unknown facet '{facet}'."}, status=400)
+    return JsonResponse(data_handler.get_timeline(facet or None))
+
 def about(request):
     return render(request, "about.html")